@@ -6,15 +6,270 @@ A sweet and tart resume generator that converts Markdown to beautiful PDF resume
 
 import sys
 import argparse
+import functools
 import re
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, Iterator, List, Optional, Tuple
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import letter
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
 from reportlab.lib.enums import TA_LEFT, TA_CENTER, TA_RIGHT
+from reportlab.pdfbase import pdfmetrics
+
+# google-re2 guarantees linear-time matching for the contact link pattern
+try:
+    import re2
+except ImportError:
+    re2 = None
+
+
+# Markdown link pattern, used for contact lines
+_RE_LINK = (re2 or re).compile(r'\[([^\]]+)\]\(([^\)]+)\)')
+
+# Characters that may open an inline markdown construct. Always the stdlib
+# engine: it is searched repeatedly from an offset, which re2 would pay for
+# by re-encoding the whole string on every call
+_RE_MARKER = re.compile(r'[\[`*_]')
+
+
+def _inline_span(text: str, i: int) -> Optional[Tuple[str, int]]:
+    """Render the inline construct opening at ``text[i]``.
+
+    Returns the markup and the index just past the construct, or None if
+    the marker at ``i`` is a literal character.
+    """
+    c = text[i]
+    
+    # Link: [text](url) -> <a href="url">text</a>
+    if c == '[':
+        close = text.find(']', i + 1)
+        if close > i + 1 and text.startswith('(', close + 1):
+            end = text.find(')', close + 2)
+            if end > close + 2:
+                label = _inline_to_html(text[i + 1:close])
+                return f'<a href="{text[close + 2:end]}" color="#3498db">{label}</a>', end + 1
+        return None
+    
+    # Code: `text` -> <font face="Courier">text</font>, contents left as-is
+    if c == '`':
+        end = text.find('`', i + 1)
+        if end > i + 1:
+            return f'<font face="Courier" color="#e74c3c">{text[i + 1:end]}</font>', end + 1
+        return None
+    
+    # Bold italic: ***text*** -> <i><b>text</b></i>. Not a separate pass in
+    # the original regex pipeline, which got this nesting from running bold
+    # before italic; handled explicitly to keep that output
+    if text.startswith('***', i):
+        end = text.find('*', i + 3)
+        if end > i + 3 and text.startswith('***', end):
+            return f'<i><b>{_inline_to_html(text[i + 3:end])}</b></i>', end + 3
+        return None
+    
+    # Bold: **text** or __text__ -> <b>text</b>
+    double = c * 2
+    if text.startswith(double, i):
+        end = text.find(c, i + 2)
+        if end > i + 2 and text.startswith(double, end):
+            return f'<b>{_inline_to_html(text[i + 2:end])}</b>', end + 2
+        return None
+    
+    # Italic: *text* or _text_ -> <i>text</i>. May contain bold spans, as
+    # *a **b** c* rendered with the bold-then-italic regex passes
+    if i > 0 and text[i - 1] == c:
+        return None
+    j = i + 1
+    while True:
+        j = text.find(c, j)
+        if j < 0:
+            return None
+        if not text.startswith(double, j):
+            break
+        end = text.find(c, j + 2)
+        if end <= j + 2 or not text.startswith(double, end):
+            return None
+        j = end + 2
+    if j > i + 1:
+        return f'<i>{_inline_to_html(text[i + 1:j])}</i>', j + 1
+    return None
+
+
+def _inline_to_html(text: str) -> str:
+    """Convert inline markdown (links, code, bold, italic) to reportlab markup."""
+    # Most lines carry no markup; return them untouched
+    if '*' not in text and '_' not in text and '[' not in text and '`' not in text:
+        return text
+    
+    out = []
+    start = i = 0
+    while True:
+        # Jump straight to the next marker instead of stepping per character
+        marker = _RE_MARKER.search(text, i)
+        if marker is None:
+            break
+        i = marker.start()
+        span = _inline_span(text, i)
+        if span is None:
+            i += 1
+            continue
+        out.append(text[start:i])
+        out.append(span[0])
+        i = start = span[1]
+    out.append(text[start:])
+    return ''.join(out)
+
+
+def _header_bounds(lines: List[str]) -> Tuple[int, int]:
+    """Find the resume header in a list of stripped lines.
+
+    Returns the index of the '# ' title line and the index where the header
+    ends; plain lines strictly between the two are contact info. The header
+    ends at the first '## ' section heading. A resume with no section
+    headings ends its header at the first heading line or the first blank
+    line after a contact line, whichever comes first. Without a title there
+    is no header.
+    """
+    n = len(lines)
+    title_line = next((i for i, line in enumerate(lines) if line.startswith('# ')), n)
+    header_end = next(
+        (i for i in range(title_line + 1, n) if lines[i].startswith('## ')),
+        None,
+    )
+    if header_end is not None:
+        return title_line, header_end
+    
+    seen_contact = False
+    for i in range(title_line + 1, n):
+        line = lines[i]
+        if not line:
+            if seen_contact:
+                return title_line, i
+        elif line[0] == '#':
+            return title_line, i
+        elif line[0] not in '*-':
+            seen_contact = True
+    return title_line, n
+
+
+@functools.lru_cache(maxsize=1)
+def _get_styles() -> Dict:
+    """Create custom styles for the resume, once per process."""
+    base_styles = getSampleStyleSheet()
+    
+    styles = {
+        'Title': ParagraphStyle(
+            'CustomTitle',
+            parent=base_styles['Title'],
+            fontSize=24,
+            textColor=colors.HexColor('#1a1a1a'),
+            spaceAfter=6,
+            alignment=TA_CENTER,
+            fontName='Helvetica-Bold',
+        ),
+        'Subtitle': ParagraphStyle(
+            'CustomSubtitle',
+            parent=base_styles['Normal'],
+            fontSize=11,
+            textColor=colors.HexColor('#555555'),
+            spaceAfter=12,
+            alignment=TA_CENTER,
+            fontName='Helvetica',
+        ),
+        'Heading1': ParagraphStyle(
+            'CustomHeading1',
+            parent=base_styles['Heading1'],
+            fontSize=14,
+            textColor=colors.HexColor('#2c3e50'),
+            spaceAfter=8,
+            spaceBefore=12,
+            fontName='Helvetica-Bold',
+            borderWidth=1,
+            borderColor=colors.HexColor('#3498db'),
+            borderPadding=4,
+            leftIndent=0,
+        ),
+        'Heading2': ParagraphStyle(
+            'CustomHeading2',
+            parent=base_styles['Heading2'],
+            fontSize=12,
+            textColor=colors.HexColor('#34495e'),
+            spaceAfter=6,
+            spaceBefore=8,
+            fontName='Helvetica-Bold',
+        ),
+        'Normal': ParagraphStyle(
+            'CustomNormal',
+            parent=base_styles['Normal'],
+            fontSize=10,
+            textColor=colors.HexColor('#2c3e50'),
+            spaceAfter=6,
+            fontName='Helvetica',
+            leading=14,
+        ),
+        'Bullet': ParagraphStyle(
+            'CustomBullet',
+            parent=base_styles['Normal'],
+            fontSize=10,
+            textColor=colors.HexColor('#2c3e50'),
+            leftIndent=20,
+            spaceAfter=4,
+            fontName='Helvetica',
+            bulletIndent=10,
+            bulletText='\u2022',
+            bulletColor=colors.HexColor('#2c3e50'),
+            leading=13,
+        ),
+        'Contact': ParagraphStyle(
+            'CustomContact',
+            parent=base_styles['Normal'],
+            fontSize=10,
+            textColor=colors.HexColor('#555555'),
+            alignment=TA_CENTER,
+            spaceAfter=2,
+            fontName='Helvetica',
+        ),
+    }
+    styles['BoldNormal'] = ParagraphStyle(
+        'CustomBoldNormal',
+        parent=styles['Normal'],
+        fontName='Helvetica-Bold',
+    )
+    
+    return styles
+
+
+# Page size and margins shared by every generated document
+_PAGE_LAYOUT = {
+    'pagesize': letter,
+    'topMargin': 0.5*inch,
+    'bottomMargin': 0.5*inch,
+    'leftMargin': 0.75*inch,
+    'rightMargin': 0.75*inch,
+}
+
+# Standard Type 1 fonts used by the styles and inline markup
+_FONTS = (
+    'Helvetica',
+    'Helvetica-Bold',
+    'Helvetica-Oblique',
+    'Helvetica-BoldOblique',
+    'Courier',
+)
+
+
+def _register_fonts():
+    """Register the fonts up front so document builds find them cached."""
+    registered = set(pdfmetrics.getRegisteredFontNames())
+    for name in _FONTS:
+        if name not in registered:
+            # Standard fonts register themselves on first lookup
+            pdfmetrics.getFont(name)
+
+
+_register_fonts()
 
 
 class ResumeGenerator:
@@ -23,196 +278,121 @@ class ResumeGenerator:
     def __init__(self, markdown_file: Path, output_file: Path = None):
         self.markdown_file = markdown_file
         self.output_file = output_file or markdown_file.with_suffix('.pdf')
-        self.styles = self._create_styles()
-        
-    def _create_styles(self) -> Dict:
-        """Create custom styles for the resume."""
-        base_styles = getSampleStyleSheet()
-        
-        styles = {
-            'Title': ParagraphStyle(
-                'CustomTitle',
-                parent=base_styles['Title'],
-                fontSize=24,
-                textColor=colors.HexColor('#1a1a1a'),
-                spaceAfter=6,
-                alignment=TA_CENTER,
-                fontName='Helvetica-Bold',
-            ),
-            'Subtitle': ParagraphStyle(
-                'CustomSubtitle',
-                parent=base_styles['Normal'],
-                fontSize=11,
-                textColor=colors.HexColor('#555555'),
-                spaceAfter=12,
-                alignment=TA_CENTER,
-                fontName='Helvetica',
-            ),
-            'Heading1': ParagraphStyle(
-                'CustomHeading1',
-                parent=base_styles['Heading1'],
-                fontSize=14,
-                textColor=colors.HexColor('#2c3e50'),
-                spaceAfter=8,
-                spaceBefore=12,
-                fontName='Helvetica-Bold',
-                borderWidth=1,
-                borderColor=colors.HexColor('#3498db'),
-                borderPadding=4,
-                leftIndent=0,
-            ),
-            'Heading2': ParagraphStyle(
-                'CustomHeading2',
-                parent=base_styles['Heading2'],
-                fontSize=12,
-                textColor=colors.HexColor('#34495e'),
-                spaceAfter=6,
-                spaceBefore=8,
-                fontName='Helvetica-Bold',
-            ),
-            'Normal': ParagraphStyle(
-                'CustomNormal',
-                parent=base_styles['Normal'],
-                fontSize=10,
-                textColor=colors.HexColor('#2c3e50'),
-                spaceAfter=6,
-                fontName='Helvetica',
-                leading=14,
-            ),
-            'Bullet': ParagraphStyle(
-                'CustomBullet',
-                parent=base_styles['Normal'],
-                fontSize=10,
-                textColor=colors.HexColor('#2c3e50'),
-                leftIndent=20,
-                spaceAfter=4,
-                fontName='Helvetica',
-                bulletIndent=10,
-                leading=13,
-            ),
-            'Contact': ParagraphStyle(
-                'CustomContact',
-                parent=base_styles['Normal'],
-                fontSize=10,
-                textColor=colors.HexColor('#555555'),
-                alignment=TA_CENTER,
-                spaceAfter=2,
-                fontName='Helvetica',
-            ),
-        }
-        
-        return styles
+        self.styles = _get_styles()
 
     def parse_markdown(self) -> List:
         """Parse markdown file and convert to PDF elements."""
-        with open(self.markdown_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        elements = []
-        lines = content.split('\n')
-        i = 0
-        in_list = False
+        return list(self._iter_elements())
+
+    def _iter_elements(self) -> Iterator:
+        """Yield PDF elements one at a time as the markdown is parsed."""
+        lines = [line.strip() for line in
+                 self.markdown_file.read_text(encoding='utf-8').splitlines()]
+        title_line, header_end = _header_bounds(lines)
         
-        while i < len(lines):
-            line = lines[i].strip()
-            
-            # Skip empty lines but add small spacer
+        for i, line in enumerate(lines):
+            # Skip empty lines
             if not line:
-                if in_list:
-                    in_list = False
-                i += 1
                 continue
             
-            # Title (# heading at start or standalone bold text)
-            if line.startswith('# '):
-                text = line[2:].strip()
-                elements.append(Paragraph(text, self.styles['Title']))
-                in_list = False
+            # Headings and list items are keyed on the first token; only
+            # lines opening with a marker character need splitting
+            marker = text = None
+            if line[0] in '#-*':
+                head, sep, rest = line.partition(' ')
+                if sep:
+                    marker, text = head, rest.strip()
+            
+            match marker:
+                # Title (# heading)
+                case '#':
+                    yield Paragraph(text, self.styles['Title'])
                 
-            # Contact info or subtitle (lines right after title)
-            elif i > 0 and not line.startswith('#') and not line.startswith('*') and not line.startswith('-') and len(elements) <= 3:
-                # Clean up common markdown link syntax for display
-                text = re.sub(r'\[([^\]]+)\]\(([^\)]+)\)', r'<a href="\2">\1</a>', line)
-                elements.append(Paragraph(text, self.styles['Contact']))
+                # Heading 2 (## heading)
+                case '##':
+                    yield Spacer(1, 0.1*inch)
+                    yield Paragraph(text, self.styles['Heading1'])
                 
-            # Heading 2 (## heading)
-            elif line.startswith('## '):
-                text = line[3:].strip()
-                elements.append(Spacer(1, 0.1*inch))
-                elements.append(Paragraph(text, self.styles['Heading1']))
-                in_list = False
+                # Heading 3 (### heading)
+                case '###':
+                    yield Paragraph(text, self.styles['Heading2'])
                 
-            # Heading 3 (### heading)
-            elif line.startswith('### '):
-                text = line[4:].strip()
-                elements.append(Paragraph(text, self.styles['Heading2']))
-                in_list = False
+                # Bullet point or list item
+                case '-' | '*':
+                    # Handle nested markdown (bold, italic, links); the
+                    # style's bullet glyph is drawn at bulletIndent
+                    text = _inline_to_html(text)
+                    yield Paragraph(text, self.styles['Bullet'])
                 
-            # Bold standalone line (job title, degree, etc.)
-            elif line.startswith('**') and line.endswith('**'):
-                text = line[2:-2]
-                elements.append(Paragraph(f'<b>{text}</b>', self.styles['Normal']))
-                in_list = False
+                # Contact info or subtitle (header lines after the title)
+                case _ if title_line < i < header_end and line[0] not in '#*-':
+                    # Clean up common markdown link syntax for display
+                    text = _RE_LINK.sub(r'<a href="\2">\1</a>', line) if '[' in line else line
+                    yield Paragraph(text, self.styles['Contact'])
                 
-            # Bullet point or list item
-            elif line.startswith('- ') or line.startswith('* '):
-                text = line[2:].strip()
-                # Handle nested markdown (bold, italic, links)
-                text = self._process_inline_markdown(text)
-                elements.append(Paragraph(f'• {text}', self.styles['Bullet']))
-                in_list = True
+                # Bold standalone line (job title, degree, etc.)
+                case _ if len(line) >= 4 and line[:2] == '**' == line[-2:]:
+                    yield Paragraph(line[2:-2], self.styles['BoldNormal'])
                 
-            # Regular paragraph
-            else:
-                # Process inline markdown
-                text = self._process_inline_markdown(line)
-                elements.append(Paragraph(text, self.styles['Normal']))
-                in_list = False
-            
-            i += 1
-        
-        return elements
-
-    def _process_inline_markdown(self, text: str) -> str:
-        """Process inline markdown formatting (bold, italic, links)."""
-        # Links: [text](url) -> <a href="url">text</a>
-        text = re.sub(r'\[([^\]]+)\]\(([^\)]+)\)', r'<a href="\2" color="#3498db">\1</a>', text)
-        
-        # Bold: **text** or __text__ -> <b>text</b>
-        # Process double markers first to avoid conflicts with single markers
-        text = re.sub(r'\*\*([^\*]+)\*\*', r'<b>\1</b>', text)
-        text = re.sub(r'__([^_]+)__', r'<b>\1</b>', text)
-        
-        # Italic: *text* or _text_ -> <i>text</i>
-        # Use negative lookahead/lookbehind to avoid matching double markers
-        text = re.sub(r'(?<!\*)\*(?!\*)([^\*]+)\*(?!\*)', r'<i>\1</i>', text)
-        text = re.sub(r'(?<!_)_(?!_)([^_]+)_(?!_)', r'<i>\1</i>', text)
-        
-        # Code: `text` -> <font face="Courier">text</font>
-        text = re.sub(r'`([^`]+)`', r'<font face="Courier" color="#e74c3c">\1</font>', text)
-        
-        return text
+                # Regular paragraph
+                case _:
+                    # Process inline markdown
+                    text = _inline_to_html(line)
+                    yield Paragraph(text, self.styles['Normal'])
 
     def generate_pdf(self):
         """Generate the PDF resume."""
         # Create PDF document
-        doc = SimpleDocTemplate(
-            str(self.output_file),
-            pagesize=letter,
-            topMargin=0.5*inch,
-            bottomMargin=0.5*inch,
-            leftMargin=0.75*inch,
-            rightMargin=0.75*inch,
-        )
+        doc = SimpleDocTemplate(str(self.output_file), **_PAGE_LAYOUT)
         
-        # Parse markdown and get elements
-        elements = self.parse_markdown()
-        
-        # Build PDF
-        doc.build(elements)
+        # Parse markdown and build PDF (reportlab needs a list)
+        doc.build(list(self._iter_elements()))
         print(f"✅ Resume generated successfully: {self.output_file}")
 
 
+def _render_one(markdown_file: Path, output_file: Path = None):
+    """Generate a single resume; runs in a worker process in batch mode."""
+    ResumeGenerator(markdown_file, output_file).generate_pdf()
+
+
+def _generate_batch(directory: Path, output_dir: Path = None) -> int:
+    """Generate a resume for every Markdown file in a directory.
+
+    Files are rendered in parallel, one per process. Returns the number of
+    errors reported, so zero means every resume was generated.
+    """
+    markdown_files = sorted(directory.glob('*.md'))
+    if not markdown_files:
+        print(f"❌ Error: No Markdown files found in '{directory}'", file=sys.stderr)
+        return 1
+    
+    if output_dir is not None:
+        try:
+            output_dir.mkdir(parents=True, exist_ok=True)
+        except OSError as e:
+            print(f"❌ Error creating output directory '{output_dir}': {e}", file=sys.stderr)
+            return 1
+    
+    failures = 0
+    with ProcessPoolExecutor() as executor:
+        futures = {
+            path: executor.submit(
+                _render_one,
+                path,
+                output_dir / path.with_suffix('.pdf').name if output_dir else None,
+            )
+            for path in markdown_files
+        }
+        for path, future in futures.items():
+            try:
+                future.result()
+            except Exception as e:
+                print(f"❌ Error generating resume from '{path}': {e}", file=sys.stderr)
+                failures += 1
+    
+    return failures
+
+
 def main():
     """Main entry point for the resume generator."""
     parser = argparse.ArgumentParser(
@@ -222,6 +402,7 @@ def main():
 Examples:
   python pineapple.py resume.md
   python pineapple.py resume.md -o john_doe_resume.pdf
+  python pineapple.py resumes/ -o pdfs/
   python pineapple.py --help
 
 For more information, visit: https://github.com/pid1/pineapple
@@ -231,13 +412,14 @@ For more information, visit: https://github.com/pid1/pineapple
     parser.add_argument(
         'markdown_file',
         type=Path,
-        help='Input Markdown resume file'
+        help='Input Markdown resume file, or a directory of them to convert in parallel'
     )
     
     parser.add_argument(
         '-o', '--output',
         type=Path,
-        help='Output PDF file (default: same name as input with .pdf extension)'
+        help='Output PDF file, or output directory when converting a directory '
+             '(default: same name as input with .pdf extension)'
     )
     
     args = parser.parse_args()
@@ -247,6 +429,12 @@ For more information, visit: https://github.com/pid1/pineapple
         print(f"❌ Error: File '{args.markdown_file}' not found", file=sys.stderr)
         sys.exit(1)
     
+    # Generate every resume in a directory
+    if args.markdown_file.is_dir():
+        if _generate_batch(args.markdown_file, args.output):
+            sys.exit(1)
+        return
+    
     # Generate resume
     try:
         generator = ResumeGenerator(args.markdown_file, args.output)